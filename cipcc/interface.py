@@ -32,6 +32,8 @@ class Profile:
     Class storing a collection of parsed interfaces and
     associated information.
     """
+    __slots__ = 'serializable_types', 'interfaces'
+
     serializable_types: ty.Dict[str, 'Serializable']
     interfaces: ty.Dict[str, 'Interface']
 
@@ -50,6 +52,8 @@ class Serializable:
         STRUCT = 'struct'
         BUILTIN = 'builtin'
 
+    __slots__ = 'name', 'type'
+
     name: str  # Type name, as it appears in C++.
     type: Type
 
@@ -89,6 +93,8 @@ class Method:
     """
     Stores information about a specific interface method.
     """
+    __slots__ = 'name', 'return_type', 'parameters'
+
     name: str  # method name, as it appears in C++.
     return_type: str
     parameters: ty.List['Parameter']
@@ -99,6 +105,11 @@ class Callback:
     """
     Stores information about a specific interface callback.
     """
+    __slots__ = (
+        'name', 'register_method', 'remove_method', 'return_type',
+        'parameters',
+    )
+
     name: str
     register_method: str
     remove_method: str
@@ -119,5 +130,7 @@ class Parameter:
     The only supported reference type is the const reference, which is
     used to pass values without unneeded copying.
     """
+    __slots__ = 'name', 'type'
+
     name: str
     type: str
@@ -23,12 +23,15 @@ Module containing interface parser.
 """
 import ast
 import contextlib
+import dataclasses
 from dataclasses import dataclass
 import enum
 import functools
 import itertools
 from pathlib import Path
 import re
+import sys
+import types
 import typing as ty
 
 from .interface import (
@@ -204,9 +207,14 @@ class CodeState:
     brace_stack: ty.List[str]
     statement_braces: ty.List[str]
     line: str
-    commented_line: str
-    scope_text: ty.List[str]
+    prev_char: str  # Previous char on the current line, or ''.
+    scope_text: ty.List[ty.List[str]]  # Text since last statement.
     observers: ty.List['CodeObserver']
+    observers_by_event: ty.Dict[int, ty.Tuple['CodeObserver', ...]] = \
+        dataclasses.field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self._index_observers()
 
     @property
     def is_quoted(self):
@@ -222,17 +230,41 @@ class CodeState:
 
     def add_observer(self, observer: 'CodeObserver') -> None:
         self.observers.append(observer)
+        self._index_observers()
 
     def remove_observer(self, observer: 'CodeObserver') -> None:
         self.observers.remove(observer)
+        self._index_observers()
+
+    def set_observer_events(
+            self, observer: 'CodeObserver', events: int
+    ) -> None:
+        """Changes the events an added observer is notified of."""
+        observer.events = events
+        self._index_observers()
 
     def notify(self, event: 'CodeEvent') -> None:
-        for observer in self.observers:
-            if observer.events & event:
-                observer(event, self)
+        for observer in self.observers_by_event[event]:
+            observer.fn(event, self)
+
+    def _index_observers(self) -> None:
+        # Observers change far less often than events are produced, so
+        # they are grouped by event ahead of time. New tuples are built
+        # so that notify() calls already in progress are not affected.
+        self.observers_by_event = {
+            event: tuple(
+                observer for observer in self.observers
+                if observer.events & event
+            )
+            for event in CodeEvent
+        }
 
     def scope_statement(self, scope_index: int = -1):
-        scope_text = self.scope_text[scope_index]
+        # Chars are appended individually while walking; joining them
+        # here and storing the result avoids re-joining them next time.
+        scope_chars = self.scope_text[scope_index]
+        scope_text = ''.join(scope_chars)
+        scope_chars[:] = [scope_text]
         return scope_text[scope_text.rfind(';') + 1:]
 
     @property
@@ -283,10 +315,14 @@ class CodeObserver:
         self.events = events
 
     def __call__(self, event: 'CodeEvent', state: 'CodeState') -> None:
-        assert event & self.events
         self.fn(event, state)
 
 
+# Runs of text which code_walk() does not need to inspect char by char.
+CODE_TEXT_PATTERN = re.compile(r'[^\n"\'{}\[\]()/*;]+')
+QUOTED_TEXT_PATTERN = re.compile(r'[^\n"\'\\]+')
+
+
 def code_walk(
         text: str, source_name: str, observers: ty.Iterable[CodeObserver]
 ) -> None:
@@ -321,44 +357,84 @@ def code_walk(
         brace_depth={brace_pair[0]: 0 for brace_pair in BRACE_PAIRS},
         brace_stack=[],
         statement_braces=[],
-        commented_line='',
         line='',
-        scope_text=[''],
+        prev_char='',
+        scope_text=[[]],
         observers=list(observers),
     )
 
-    while state.index < len(text):
+    # Bound to locals since they are used for every char or run.
+    text_len = len(text)
+    scope_text = state.scope_text
+    match_code = CODE_TEXT_PATTERN.match
+    match_quoted = QUOTED_TEXT_PATTERN.match
+
+    while state.index < text_len:
+        quoted = state.is_quoted
+
+        # Comment text produces no events, so it is consumed in bulk up
+        # to the next line end or the end of the comment.
+        if state.comment_start:
+            stop = text.find('\n', state.index)
+            if stop == -1:
+                stop = text_len
+            if state.comment_start == '/*':
+                comment_end = text.find('*/', state.index, stop)
+                if comment_end != -1:
+                    stop = comment_end + 1
+            comment_text = text[state.index:stop]
+            state.index = stop
+            state.col_no += len(comment_text)
+            state.line += comment_text
+            if comment_text:
+                state.prev_char = comment_text[-1]
+            if state.index == text_len:
+                break
+
+        # Likewise, runs of chars which cannot start or end a comment,
+        # quote, scope, statement or line are consumed in bulk.
+        elif not state.escape:
+            match = (match_quoted if quoted else match_code)(text, state.index)
+            if match:
+                run = match.group()
+                state.index = match.end()
+                state.col_no += len(run)
+                state.line += run
+                state.prev_char = run[-1]
+                scope_text[-1].append(run)
+                if state.index == text_len:
+                    break
+
         char = text[state.index]
         initial_scope = state.scope_index
         initial_line = state.line_no
         deferred_event = 0
 
         # Handle comments.
-        if not state.is_quoted:
-            if char in '/*' and state.commented_line.endswith('/'):  # Start
+        prev_char = char if char != '\n' else ''
+        if not quoted:
+            if state.prev_char == '/' and char in '/*':  # Start
                 state.comment_start = '/' + char
                 state.line = state.line[:-1]
-                state.scope_text[state.scope_index] = \
-                    state.scope_text[state.scope_index][:-1]
-            elif all((
-                state.comment_start == '/*',
-                char == '/',
-                state.commented_line.endswith('*')
-            )):  # End
+                scope_chars = scope_text[-1]
+                if scope_chars:
+                    scope_chars[-1] = scope_chars[-1][:-1]
+            elif state.comment_start == '/*' and \
+                    state.prev_char == '*' and char == '/':  # End
                 state.comment_start = ''
-        if char != '\n':
-            state.commented_line += char
+                # The closing '/' cannot also begin the next comment.
+                prev_char = ''
+        state.prev_char = prev_char
 
         # Handle code constructs.
         if char == '\n':
             state.notify(CodeEvent.LINE_END)
             state.line = ''
-            state.commented_line = ''
             state.line_no += 1
             state.col_no = 0
             if state.comment_start == '//':
                 state.comment_start = ''
-        elif state.is_quoted:
+        elif quoted:
             if state.escape:
                 state.escape = False
             else:
@@ -367,19 +443,19 @@ def code_walk(
                 elif char in '"\'' and state.quoting[char]:
                     state.quoting[char] = False
                     state.notify(CodeEvent.QUOTE_END)
-                    state.scope_text.pop()
+                    scope_text.pop()
         elif not state.is_commented:
             if char in '"\'':  # Begin quote.
                 state.quoting[char] = True
-                state.scope_text.append('')
+                scope_text.append([])
                 deferred_event = CodeEvent.QUOTE_START
             elif char in BRACE_START_CHARS:  # Begin block.
                 state.brace_depth[char] += 1
                 state.brace_stack.append(char)
-                state.scope_text.append('')
+                scope_text.append([])
                 deferred_event = CodeEvent.BRACKET_START
             elif char in BRACE_END_CHARS:  # End block.
-                matching_brace = _paired_brace(char)
+                matching_brace = _PAIRED_BRACES[char]
                 if not state.brace_stack:
                     raise ParsingError(
                         state,
@@ -395,17 +471,20 @@ def code_walk(
                 state.notify(CodeEvent.BRACKET_END)
                 state.brace_depth[matching_brace] -= 1
                 state.brace_stack.pop()
-                state.scope_text.pop()
+                scope_text.pop()
             elif char == ';':
                 # Handle statement end.
                 # Note that this does not handle control flow blocks,
                 # however it is sufficient for cipc's uses.
                 state.notify(CodeEvent.STATEMENT_END)
+                # Text preceding the statement end is no longer needed.
+                # Discarding it keeps appends to the scope text cheap.
+                scope_text[-1].clear()
 
         # Common bookkeeping.
         state.index += 1
         if not state.is_commented:
-            state.scope_text[min(initial_scope, state.scope_index)] += char
+            scope_text[min(initial_scope, state.scope_index)].append(char)
         if state.line_no == initial_line:
             state.col_no += 1
             state.line += char
@@ -441,12 +520,17 @@ def parse(
         elif annotation.key == 'Interface':
             state.add_observer(InterfaceCodeObserver(profile, namespace))
 
-    for header in explore_includes(headers, include_dirs):
+    sources: ty.Dict[Path, str] = {}
+    for header in explore_includes(headers, include_dirs, sources):
         if header.is_dir():
             raise ValueError(
                 f'Passed path: {header} is a directory, not a header.'
             )
-        text = header.read_text()
+        text = sources[header]
+        if '@IPC(' not in text:
+            # Headers without annotations add nothing to the profile,
+            # such as the dependencies of annotated headers.
+            continue
         root_observer = CodeObserver(
             watch_for_root_annotations, events=CodeEvent.LINE_END
         )
@@ -458,6 +542,10 @@ def parse(
 #######################################################################
 # Code observer definitions.
 
+# Matches code preceding a declaration, such as the bodies of earlier
+# functions or types, so that it can be left out of error messages.
+DECLARATION_PREFIX_PATTERN = re.compile(r'(?:.*})?\s*', flags=re.DOTALL)
+
 
 class NamespaceObserver(CodeObserver):
     """
@@ -521,7 +609,7 @@ class SerializableCodeObserver(CodeObserver):
         self.namespace = namespace
         self.auto = auto
         self.name = None
-        self.scope_brace_stack = []
+        self.scope_depth = 0  # Brace depth within the type's body.
         self.profile = profile
         self.serializable = None
         self.field_observer = None
@@ -531,7 +619,9 @@ class SerializableCodeObserver(CodeObserver):
             declaration = state.scope_prefix
             match = self.DECLARATION_PATTERN.search(declaration)
             if not match:
-                prefix_text = remove_prefix(r'(?.*})\s*', declaration)
+                prefix_text = remove_prefix(
+                    DECLARATION_PREFIX_PATTERN, declaration
+                )
                 raise ParsingError(
                     state,
                     'Serializable type had unrecognized declaration: '
@@ -544,7 +634,7 @@ class SerializableCodeObserver(CodeObserver):
                 'class': Serializable.Type.STRUCT,
                 'enum': Serializable.Type.ENUM,
             }[match['type']]
-            self.scope_brace_stack = state.brace_stack.copy()
+            self.scope_depth = len(state.brace_stack)
             if self.name in self.profile.serializable_types:
                 raise ParsingError(
                     state,
@@ -561,9 +651,9 @@ class SerializableCodeObserver(CodeObserver):
             else:
                 self.serializable = Serializable(self.name, self.type)
             self.profile.serializable_types[self.name] = self.serializable
-            self.events = CodeEvent.BRACKET_END
+            state.set_observer_events(self, CodeEvent.BRACKET_END)
         elif event == CodeEvent.BRACKET_END:
-            if state.brace_stack == self.scope_brace_stack:
+            if len(state.brace_stack) == self.scope_depth:
                 state.remove_observer(self)
                 if self.field_observer:
                     state.remove_observer(self.field_observer)
@@ -591,7 +681,7 @@ class AutoFieldCodeObserver(CodeObserver):
         self.serializable_observer = serializable_observer
 
     def __call__(self, event: 'CodeEvent', state: 'CodeState') -> None:
-        if state.brace_stack != self.serializable_observer.scope_brace_stack:
+        if len(state.brace_stack) != self.serializable_observer.scope_depth:
             return
 
         profile = self.serializable_observer.profile
@@ -632,7 +722,7 @@ class ExplicitFieldCodeObserver(CodeObserver):
         self.field_prefix = None
 
     def __call__(self, event: 'CodeEvent', state: 'CodeState') -> None:
-        if state.brace_stack != self.serializable_observer.scope_brace_stack:
+        if len(state.brace_stack) != self.serializable_observer.scope_depth:
             return
 
         if event == CodeEvent.LINE_END:
@@ -684,7 +774,9 @@ class InterfaceCodeObserver(CodeObserver):
             declaration = state.scope_prefix
             match = self.DECLARATION_PATTERN.search(declaration)
             if not match:
-                prefix_text = remove_prefix(r'(?.*})\s*', declaration)
+                prefix_text = remove_prefix(
+                    DECLARATION_PREFIX_PATTERN, declaration
+                )
                 raise ParsingError(
                     state,
                     'Interface had unrecognized declaration: '
@@ -715,7 +807,7 @@ class InterfaceCodeObserver(CodeObserver):
             self.interface = Interface(self.name)
             self.method_observer = MethodCodeObserver(self)
             self.profile.interfaces[self.name] = self.interface
-            self.events = CodeEvent.BRACKET_END
+            state.set_observer_events(self, CodeEvent.BRACKET_END)
             state.add_observer(self.method_observer)
         elif event == CodeEvent.BRACKET_END and \
                 state.brace_stack == self.scope_brace_stack:
@@ -783,11 +875,12 @@ class MethodCodeObserver(CodeObserver):
             return
         self.ignored_method_prefix = state.statement
         self.annotation_line_no = state.line_no
-        self.events |= (
+        state.set_observer_events(self, (
+                self.events |
                 CodeEvent.BRACKET_START |
                 CodeEvent.BRACKET_END |
                 CodeEvent.STATEMENT_END
-        )
+        ))
         self.declaration = ''
 
     def _handle_round_bracket_open(self, state: 'CodeState') -> None:
@@ -820,7 +913,7 @@ class MethodCodeObserver(CodeObserver):
         self.ignored_method_prefix = None  # Reset.
         self.declaration = None  # Reset
         self.annotation_line_no = None  # Reset
-        self.events = CodeEvent.LINE_END  # Reset
+        state.set_observer_events(self, CodeEvent.LINE_END)  # Reset
 
     @property
     def interface_brace_stack(self) -> ty.List[str]:
@@ -835,23 +928,26 @@ class MethodCodeObserver(CodeObserver):
 # Parsing utilities
 
 
-ANNOTATION_PATTERN = re.compile(r'@IPC\((.*)\)')
+ANNOTATION_PREFIX = '@IPC('
 ANNOTATION_CONTENT = re.compile(
     r'\s*([a-zA-Z]+)\s*'
     r'((?:,\s*[a-zA-Z][a-zA-Z0-9]*(?:\s*=\s*?[a-zA-Z0-9]+)?)*)'
 )
-KEY_VALUE_PATTERN = re.compile(
-    r'([a-zA-Z][a-zA-Z0-9]*)(?:\s*=\s*([a-zA-Z0-9]+))?'
-)
+
+
+# Shared read-only kwargs for the common case of a bare annotation.
+EMPTY_KWARGS: ty.Mapping[str, ty.Any] = types.MappingProxyType({})
 
 
 class Annotation(ty.NamedTuple):
     key: str
-    kwargs: ty.Dict[str, ty.Any]
+    kwargs: ty.Mapping[str, ty.Any]  # Read-only; shared when empty.
 
 
 def explore_includes(
-        headers: ty.Iterable[Path], include_dirs: ty.Iterable[Path]
+        headers: ty.Iterable[Path],
+        include_dirs: ty.Iterable[Path],
+        sources: ty.Optional[ty.Dict[Path, str]] = None,
 ) -> ty.List[Path]:
     """
     Explores the passed header files for their recursive includes.
@@ -866,6 +962,9 @@ def explore_includes(
 
     :param headers: Header files to read for #includes.
     :param include_dirs: Directories in which to look for includes.
+    :param sources: Optional dict in which to store the text of each
+    explored header, keyed by its returned path, so that headers need
+    not be read again when parsed.
     :return: Header paths in the order in which they should be parsed.
     """
     # Collection of include lists by the file which includes them.
@@ -879,7 +978,10 @@ def explore_includes(
             continue
 
         # Determine header includes.
-        raw_includes = read_header_includes(header)
+        text = header.read_text()
+        if sources is not None:
+            sources[header] = text
+        raw_includes = find_includes(text)
         includes = set()
         for include in raw_includes:
             with contextlib.suppress(KeyError):
@@ -894,24 +996,20 @@ def explore_includes(
     return find_parse_order(parsed_files)
 
 
-INCLUDE_PATTERN = re.compile(rb'^ *# *include *(?P<include>"[^"]+"|<[^>]+>)')
+INCLUDE_PATTERN = re.compile(
+    r'^ *# *include *(?P<include>"[^"\n]+"|<[^>\n]+>)', flags=re.MULTILINE
+)
 
 
-def read_header_includes(header: Path) -> ty.List[str]:
+def find_includes(text: str) -> ty.List[str]:
     """
-    Reads all includes which occur in a file.
+    Finds all includes which occur in header text.
 
-    :param header: Path to file to parse.
+    :param text: Header text to search.
     :return: List of included strings, including surrounding brackets
     or quote chars. Ex: ['<string>', '"foo.h"', '"baz.h"'].
     """
-    includes = []
-    with header.open('rb') as file:
-        for line in file:
-            match = INCLUDE_PATTERN.match(line)
-            if match:
-                includes.append(match['include'].decode('ascii'))
-    return includes
+    return [match['include'] for match in INCLUDE_PATTERN.finditer(text)]
 
 
 def resolve_include(include: str, include_dirs: ty.Iterable[Path]) -> Path:
@@ -983,34 +1081,49 @@ def parse_annotations(line: str) -> ty.Optional[Annotation]:
     :param line:
     :return: Annotation type string, and kwargs.
     """
-    match = ANNOTATION_PATTERN.search(line)
-    if not match:
+    # Annotation content runs from the prefix to the last closing
+    # parenthesis on the line.
+    start = line.find(ANNOTATION_PREFIX)
+    if start == -1:
+        return None  # Cheap check for the common case of an ordinary line.
+    start += len(ANNOTATION_PREFIX)
+    end = line.rfind(')', start)
+    if end == -1:
         return None
-    match = ANNOTATION_CONTENT.fullmatch(match[1])
+    match = ANNOTATION_CONTENT.fullmatch(line, start, end)
     if not match:
         raise InvalidAnnotation(f'Encountered invalid annotation: {repr(line)}')
     primary_key = match[1]
-    kwarg_string = match[2]
+    if not match[2]:
+        return Annotation(primary_key, EMPTY_KWARGS)
     kwargs = {}
-    for kwarg_string in kwarg_string.split(','):
-        match = KEY_VALUE_PATTERN.search(kwarg_string)
-        if not match:
-            continue
-        key, value = match.groups()
-        kwargs[key] = ast.literal_eval(value) if value else True
-    return Annotation(primary_key, kwargs)
+    # The kwargs have been validated by ANNOTATION_CONTENT, so they can
+    # be split apart directly. (Ex: ', auto=False, foo')
+    for kwarg_string in match[2].split(',')[1:]:
+        key, _, value = kwarg_string.partition('=')
+        value = value.strip()
+        kwargs[key.strip()] = ast.literal_eval(value) if value else True
+    return Annotation(primary_key, types.MappingProxyType(kwargs))
 
 
 LABEL_REGEX = re.compile(r'^\s+(?P<label>\w+):\s')
 FIELD_TYPE_NAME_PATTERN = re.compile(
     r'(?P<type>(?P<cv>const\s+)?(?P<base_type>[\w:]+)'
     r'(?:\s*<(?P<tparam>[\w:<>,*&\s]*)>)?'
-    r'(?P<type_suffix>(?:(?:const)?(?:\*|&|\s)+\s*)*))'
+    r'(?P<type_suffix>(?:const(?=[\s*&])|[\s*&])*))'
     r'(?<=[\s*&])(?P<name>\w+)\s*'
     r'(?P<array>(?:\[.*?])*)\s*',
     flags=re.DOTALL
 )
-FIELD_NAME_PATTERN = re.compile(r'^\s*(?P<name>\w+)')
+# Initializer of a declarator, once the contents of its groups have
+# been removed. (Ex: '= 0', '{}' or '()')
+FIELD_INITIALIZER_PATTERN = re.compile(r'(?:=\s*[^,\s][^,]*|{}|\(\))?\s*')
+# Declarators following the first one. Pointer, reference and array
+# markers are captured so that they can be rejected.
+FIELD_NAME_PATTERN = re.compile(
+    r',\s*(?P<name>[*&\s]*\w+(?:\s*\[[^,\]]*])*)\s*'
+    + FIELD_INITIALIZER_PATTERN.pattern
+)
 
 
 def parse_fields(
@@ -1030,8 +1143,7 @@ def parse_fields(
         text = text[len(match.group()):]
 
     # Parse type_name.
-    parts = text.split(',')
-    match = FIELD_TYPE_NAME_PATTERN.search(parts[0])
+    match = FIELD_TYPE_NAME_PATTERN.search(text)
     if not match:
         raise InvalidFieldDeclaration(
             f'Invalid or unrecognized field declaration: {repr(text.strip())}. '
@@ -1042,15 +1154,35 @@ def parse_fields(
         type_name = resolve_type(match['base_type'].strip(), profile, ns).name
         tparams = [
             parse_param(tparam.strip() + ' x', profile, ns).type
-            for tparam in split_params(match['tparam'] or [])
+            for tparam in split_params(match['tparam'] or '')
         ]
     except InvalidTypeError as type_error:
         raise InvalidFieldDeclaration(str(type_error)) from type_error
-    type_name += '<' + ','.join(tparams) + '>' if tparams else ''
-
-    fields = [Field(match['name'], type_name)]
-    if len(parts) > 1:
-        names = [FIELD_NAME_PATTERN.match(part)['name'] for part in parts[1:]]
+    if tparams:
+        # Composite names are interned so that fields sharing a type
+        # also share its name, rather than each holding a copy.
+        type_name = sys.intern(type_name + '<' + ','.join(tparams) + '>')
+
+    fields = [Field(sys.intern(match['name']), type_name)]
+    # Initializers may contain commas of their own (Ex: 'bar{1, 2}'),
+    # so only those outside of braces and parentheses separate names.
+    # Each declarator must begin where the previous one ended, so that
+    # no part of the declaration is silently skipped.
+    declarators = collapse_groups(text[match.end():]).rstrip()
+    if declarators.endswith(';'):
+        declarators = declarators[:-1]
+    end = FIELD_INITIALIZER_PATTERN.match(declarators).end()
+    names = []
+    while end < len(declarators):
+        name_match = FIELD_NAME_PATTERN.match(declarators, end)
+        if not name_match:
+            raise InvalidFieldDeclaration(
+                f'Invalid field declaration: {repr(text.strip())}. '
+                f'Unexpected text: {repr(declarators[end:].strip())}'
+            )
+        names.append(name_match['name'])
+        end = name_match.end()
+    if names:
         if any(
                 complex_char in text_fragment for complex_char, text_fragment in
                 itertools.product('*&[]', [type_name] + names)
@@ -1061,7 +1193,7 @@ def parse_fields(
                 f'array variables. Got declaration: {text}'
             )
         for name in names:
-            fields.append(Field(name, type_name))
+            fields.append(Field(sys.intern(name), type_name))
 
     return fields
 
@@ -1078,14 +1210,10 @@ METHOD_SIGNATURE_PATTERN = re.compile(
     r'(?P<pure>=\s*0)?$',
     flags=re.DOTALL,
 )
-COLLAPSED_PARAM_PATTERNS = [
-    (re.compile(r'\{.*}', flags=re.DOTALL), '{}'),
-    (re.compile(r'\(.*\)', flags=re.DOTALL), '()'),
-]
 PARAM_PATTERN = re.compile(
     r'(?P<type>(?P<cv>const\s+)?(?P<base_type>[\w:]+)'
     r'(?:\s*<(?P<tparam>[\w:<>,*&\s]*)>)?'
-    r'(?P<type_suffix>(?:(?:const)?(?:\*|&|\s)+\s*)*))'
+    r'(?P<type_suffix>(?:const(?=[\s*&])|[\s*&])*))'
     r'(?<=[\s*&])(?P<name>\w+)\s*'
     r'(?P<array>(?:\[.*?])*)\s*'
     r'(?:=\s*(?P<default>[\w:()\[\]{}"\s]+?))?\s*$',
@@ -1160,38 +1288,78 @@ def parse_methods(
             raise InvalidReturnTypeError(str(type_error)) from type_error
 
     # Parse parameters
-    params_text = match['params']
-    for simplifying_pattern, replacement in COLLAPSED_PARAM_PATTERNS:
-        params_text = simplifying_pattern.sub(params_text, replacement)
+    params_text = collapse_groups(match['params'])
 
     parsed_params = [
         parse_param(param_text.strip(), profile, ns)
         for param_text in split_params(params_text)
     ]
 
-    def create_signature_name(params: ty.List[Parameter]) -> str:
-        signature_parameters = ','.join(str(param_.type) for param_ in params)
-        cv = match['cv'] if match['cv'] else ''
-        return f'{name}({signature_parameters}){cv}'
+    parameters = [Parameter(param.name, param.type) for param in parsed_params]
+    cv = match['cv'] or ''
 
+    # Each optional parameter adds an overload taking the parameters
+    # which precede it. The signature name is extended by one parameter
+    # at a time, rather than rebuilt for each overload. Signature names
+    # are interned, as they are also used as method keys.
     signatures: ty.List[Method] = []
-    used_params: ty.List[Parameter] = []
-    for param in parsed_params:
+    signature_parameters = ''
+    for i, param in enumerate(parsed_params):
         if param.optional:
             signatures.append(Method(
-                create_signature_name(used_params),
+                sys.intern(f'{name}({signature_parameters}){cv}'),
                 return_type=return_type,
-                parameters=used_params.copy(),
+                parameters=parameters[:i],
             ))
-        used_params.append(Parameter(param.name, param.type))
+        if i:
+            signature_parameters += ','
+        signature_parameters += param.type
     signatures.append(Method(
-        create_signature_name(used_params),
+        sys.intern(f'{name}({signature_parameters}){cv}'),
         return_type=return_type,
-        parameters=used_params.copy(),
+        parameters=parameters,
     ))
     return signatures
 
 
+PARAM_SPLIT_PATTERN = re.compile(r'[<>,]')
+
+
+GROUP_CHAR_PATTERN = re.compile(r'[{}()]')
+
+
+def collapse_groups(text: str) -> str:
+    """
+    Removes the contents of braces and parentheses in passed text.
+
+    This allows default values such as 'std::max(1, 2)' or '{1, 2}' to
+    be split from other parameters by their commas, without those
+    default values being split themselves.
+
+    If the text's braces and parentheses are unbalanced, it is returned
+    unchanged.
+
+    :param text: Text which may contain groups. (Ex: 'int x = f(a, b)')
+    :return: Text with the contents of groups removed. (Ex: 'int x = f()')
+    """
+    parts = []
+    start = 0
+    depth = 0
+    for match in GROUP_CHAR_PATTERN.finditer(text):
+        if match.group() in '{(':
+            if depth == 0:
+                parts.append(text[start:match.end()])
+            depth += 1
+        elif depth:
+            depth -= 1
+            if depth == 0:
+                start = match.start()
+    if depth:
+        return text
+    parts.append(text[start:])
+    return ''.join(parts)
+
+
 def split_params(text: str) -> ty.List[str]:
     """
     Splits passed parameter text into individual parameters.
@@ -1209,28 +1377,28 @@ def split_params(text: str) -> ty.List[str]:
     :return: Split parameters.
     """
     params: ty.List[str] = []
-    param = ''
+    start = 0
     depth = 0
-    for char in text:
-        if char == ',' and depth == 0:
-            params.append(param.strip())
-            param = ''
-        else:
-            if char == '<':
-                depth += 1
-            elif char == '>':
-                if depth <= 0:
-                    raise InvalidMethodDeclaration(
-                        f'Mismatched angle brackets in parameter list: {text}'
-                    )
-                depth -= 1
-            param += char
+    # Only visit the chars which affect splitting, rather than every char.
+    for match in PARAM_SPLIT_PATTERN.finditer(text):
+        char = match.group()
+        if char == '<':
+            depth += 1
+        elif char == '>':
+            if depth <= 0:
+                raise InvalidMethodDeclaration(
+                    f'Mismatched angle brackets in parameter list: {text}'
+                )
+            depth -= 1
+        elif depth == 0:
+            params.append(text[start:match.start()].strip())
+            start = match.end()
     if depth > 0:
         raise InvalidMethodDeclaration(
             f'Mismatched angle brackets in parameter list: {text}'
         )
-    if param:
-        params.append(param.strip())
+    if start < len(text):
+        params.append(text[start:].strip())
     return params
 
 
@@ -1258,7 +1426,7 @@ def parse_param(
         param_type = resolve_type(match['base_type'].strip(), profile, ns).name
         tparams = [
             parse_param(tparam.strip() + ' x', profile, ns).type
-            for tparam in split_params(match['tparam'] or [])
+            for tparam in split_params(match['tparam'] or '')
         ]
     except InvalidTypeError as type_error:
         raise InvalidParamTypeError(str(type_error)) from type_error
@@ -1280,9 +1448,11 @@ def parse_param(
             f'Got: {param_type}'
         )
 
+    if tparams:
+        param_type += '<' + ','.join(tparams) + '>'
     return ParsedParam(
         name=match['name'],
-        type=param_type + ('<' + ','.join(tparams) + '>' if tparams else ''),
+        type=sys.intern(param_type),
         optional=match['default'] is not None
     )
 
@@ -1304,37 +1474,28 @@ class TypeRef(ty.NamedTuple):
 def parse_type_modifiers(
         prefix: ty.Optional[str], suffix: ty.Optional[str] = ''
 ) -> ty.List[TypeRef]:
-    prefix = prefix or ''
-    suffix = suffix or ''
-    raw_modifiers = prefix + suffix
-
-    def tokenize(text: str) -> ty.List[str]:
-        pos = 0
-        tokens = []
-        while True:
-            match = MODIFIER_PATTERN.search(text, pos)
-            if match is None:
-                break
-            pos = match.end()
-            tokens.append(match.group())
-        return tokens
-
-    def parse_tokens(tokens: ty.List[str]) -> ty.List[TypeRef]:
-        refs = []
-        const = volatile = False
-        for token in reversed(tokens):
-            if token == 'const':
-                const = True
-            elif token == 'volatile':
-                volatile = True
-            else:
-                assert token in '*&'
-                refs.append(TypeRef(token, const, volatile))
-                const = volatile = False
-        refs.append(TypeRef('', const, volatile))
-        return refs
-
-    return parse_tokens(tokenize(raw_modifiers))
+    """
+    Parses the cv qualifiers and pointer / reference modifiers of a type.
+
+    :param prefix: Text preceding the base type (Ex: 'const ').
+    :param suffix: Text following the base type (Ex: ' const* &').
+    :return: TypeRefs from the outermost modifier inwards, ending with
+    the cv qualification of the base type itself.
+    """
+    tokens = MODIFIER_PATTERN.findall((prefix or '') + (suffix or ''))
+    refs = []
+    const = volatile = False
+    for token in reversed(tokens):
+        if token == 'const':
+            const = True
+        elif token == 'volatile':
+            volatile = True
+        else:
+            assert token in '*&'
+            refs.append(TypeRef(token, const, volatile))
+            const = volatile = False
+    refs.append(TypeRef('', const, volatile))
+    return refs
 
 
 def resolve_type(
@@ -1359,8 +1520,9 @@ def resolve_type(
         for collection in (
                 BUILTIN_TYPES, profile.serializable_types, profile.interfaces
         ):
-            with contextlib.suppress(KeyError):
-                return collection[checked_name]
+            resolved = collection.get(checked_name)
+            if resolved is not None:
+                return resolved
         if not ns_parts:
             # Name has not been resolved.
             if name in UNSUPPORTED_INTS:
@@ -1402,15 +1564,16 @@ def _(pattern: re.Pattern, text: str) -> str:
 
 
 BRACE_PAIRS = '{}', '[]', '()'
-BRACE_START_CHARS = [brace_pair[0] for brace_pair in BRACE_PAIRS]
-BRACE_END_CHARS = [brace_pair[1] for brace_pair in BRACE_PAIRS]
+BRACE_START_CHARS = ''.join(brace_pair[0] for brace_pair in BRACE_PAIRS)
+BRACE_END_CHARS = ''.join(brace_pair[1] for brace_pair in BRACE_PAIRS)
+_PAIRED_BRACES = {
+    **{start: end for start, end in BRACE_PAIRS},
+    **{end: start for start, end in BRACE_PAIRS},
+}
 
 
 def _paired_brace(char: str) -> str:
-    with contextlib.suppress(ValueError):
-        index = BRACE_START_CHARS.index(char)
-        return BRACE_END_CHARS[index]
-    with contextlib.suppress(ValueError):
-        index = BRACE_END_CHARS.index(char)
-        return BRACE_START_CHARS[index]
-    raise ValueError(f'Passed char {repr(char)} is not a brace.')
+    try:
+        return _PAIRED_BRACES[char]
+    except KeyError:
+        raise ValueError(f'Passed char {repr(char)} is not a brace.') from None
@@ -25,8 +25,10 @@ import pytest
 
 from ..parser import (
     Field,
+    ParsingError,
     Annotation,
     InvalidAnnotation,
+    InvalidFieldDeclaration,
     NonExtendableMethodError,
     InvalidParamDeclaration,
     ReferenceParamError,
@@ -46,6 +48,20 @@ from ..interface import (
 )
 from .util import get_resource
 
+# Expected methods shared by several tests.
+ENCODE_INT_METHOD = Method(
+    name='Encode(int)const',
+    return_type='int',
+    parameters=[Parameter(name='foo', type='int')],
+)
+FOO_METHOD = Method('foo()', return_type='int', parameters=[])
+FOO_INT_METHOD = Method(
+    'foo(int)',
+    return_type='int',
+    parameters=[Parameter('x', type='int')],
+)
+F_CONST_METHOD = Method('f()const', return_type='int', parameters=[])
+
 
 class TestParser:
     """Contains Parser tests."""
@@ -62,23 +78,24 @@ class TestParser:
         mode = profile.serializable_types['Mode']
         assert mode.type == Serializable.Type.ENUM
 
-    def test_simple_struct(self):
-        header = get_resource('serializable/struct.h')
-        profile = parse([header])
-        foo = profile.serializable_types['Foo']
-        assert foo.type == Serializable.Type.STRUCT
-        assert isinstance(foo, SerializableStruct)
-        id_field = foo.fields['id']
-        assert id_field.name == 'id'
-        assert id_field.type_name == 'std::size_t'
-        name_field = foo.fields['name']
-        assert name_field.name == 'name'
-        assert name_field.type_name == 'std::string'
-
-    def test_simple_class(self):
-        header = get_resource('serializable/class.h')
+    @pytest.mark.parametrize(
+        'resource, name',
+        (
+            ('serializable/struct.h', 'Foo'),
+            ('serializable/class.h', 'Foo'),
+            ('serializable/struct_inline.h', 'Foo'),
+            ('serializable/struct_multiline_decl.h', 'Foo'),
+            ('serializable/struct_with_defaults.h', 'Foo'),
+            ('serializable/struct_with_comments.h', 'Foo'),
+            ('serializable/class_with_methods.h', 'Foo'),
+            ('serializable/namespaced_struct.h', 'bar::baz::Foo'),
+            ('serializable/nested_struct.h', 'bar::Interface::Foo'),
+        )
+    )
+    def test_struct(self, resource, name):
+        header = get_resource(resource)
         profile = parse([header])
-        foo = profile.serializable_types['Foo']
+        foo = profile.serializable_types[name]
         assert foo.type == Serializable.Type.STRUCT
         assert isinstance(foo, SerializableStruct)
         id_field = foo.fields['id']
@@ -94,88 +111,9 @@ class TestParser:
         foo = profile.serializable_types['Foo']
         assert foo.type == Serializable.Type.STRUCT
         assert isinstance(foo, SerializableStruct)
-        for field_name in 'a', 'b', 'c':
-            id_field = foo.fields[field_name]
-            assert id_field.name == field_name
-            assert id_field.type_name == 'std::int32_t'
-
-    def test_struct_on_single_line(self):
-        header = get_resource('serializable/struct_inline.h')
-        profile = parse([header])
-        foo = profile.serializable_types['Foo']
-        assert foo.type == Serializable.Type.STRUCT
-        assert isinstance(foo, SerializableStruct)
-        id_field = foo.fields['id']
-        assert id_field.name == 'id'
-        assert id_field.type_name == 'std::size_t'
-        name_field = foo.fields['name']
-        assert name_field.name == 'name'
-        assert name_field.type_name == 'std::string'
-
-    def test_struct_with_multiline_declaration(self):
-        header = get_resource('serializable/struct_multiline_decl.h')
-        profile = parse([header])
-        foo = profile.serializable_types['Foo']
-        assert foo.type == Serializable.Type.STRUCT
-        assert isinstance(foo, SerializableStruct)
-        id_field = foo.fields['id']
-        assert id_field.name == 'id'
-        assert id_field.type_name == 'std::size_t'
-        name_field = foo.fields['name']
-        assert name_field.name == 'name'
-        assert name_field.type_name == 'std::string'
-
-    def test_struct_with_defaults(self):
-        header = get_resource('serializable/struct_with_defaults.h')
-        profile = parse([header])
-        foo = profile.serializable_types['Foo']
-        assert foo.type == Serializable.Type.STRUCT
-        assert isinstance(foo, SerializableStruct)
-        id_field = foo.fields['id']
-        assert id_field.name == 'id'
-        assert id_field.type_name == 'std::size_t'
-        name_field = foo.fields['name']
-        assert name_field.name == 'name'
-        assert name_field.type_name == 'std::string'
-
-    def test_class_with_methods(self):
-        header = get_resource('serializable/class_with_methods.h')
-        profile = parse([header])
-        foo = profile.serializable_types['Foo']
-        assert foo.type == Serializable.Type.STRUCT
-        assert isinstance(foo, SerializableStruct)
-        id_field = foo.fields['id']
-        assert id_field.name == 'id'
-        assert id_field.type_name == 'std::size_t'
-        name_field = foo.fields['name']
-        assert name_field.name == 'name'
-        assert name_field.type_name == 'std::string'
-
-    def test_namespaced_serializable(self):
-        header = get_resource('serializable/namespaced_struct.h')
-        profile = parse([header])
-        foo = profile.serializable_types['bar::baz::Foo']
-        assert isinstance(foo, SerializableStruct)
-        assert foo.type == Serializable.Type.STRUCT
-        id_field = foo.fields['id']
-        assert id_field.name == 'id'
-        assert id_field.type_name == 'std::size_t'
-        name_field = foo.fields['name']
-        assert name_field.name == 'name'
-        assert name_field.type_name == 'std::string'
-
-    def test_nested_serializable(self):
-        header = get_resource('serializable/nested_struct.h')
-        profile = parse([header])
-        foo = profile.serializable_types['bar::Interface::Foo']
-        assert foo.type == Serializable.Type.STRUCT
-        assert isinstance(foo, SerializableStruct)
-        id_field = foo.fields['id']
-        assert id_field.name == 'id'
-        assert id_field.type_name == 'std::size_t'
-        name_field = foo.fields['name']
-        assert name_field.name == 'name'
-        assert name_field.type_name == 'std::string'
+        assert foo.fields == {
+            name: Field(name, 'std::int32_t') for name in ('a', 'b', 'c')
+        }
 
     def test_serializable_struct_in_struct(self):
         header = get_resource('serializable/struct_in_struct.h')
@@ -196,6 +134,11 @@ class TestParser:
         assert a_field.name == 'a'
         assert a_field.type_name == 'ns::A'
 
+    def test_unrecognized_serializable_declaration(self):
+        header = get_resource('serializable/union.h')
+        with pytest.raises(ParsingError):
+            parse([header])
+
     def test_accessor_method(self):
         header = get_resource('method/accessor.h')
         profile = parse([header])
@@ -241,11 +184,7 @@ class TestParser:
         interface = profile.interfaces['Interface']
         assert interface.name == 'Interface'
         accessor = interface.methods['Encode(int)const']
-        assert accessor == Method(
-            name='Encode(int)const',
-            return_type='int',
-            parameters=[Parameter(name='foo', type='int')],
-        )
+        assert accessor == ENCODE_INT_METHOD
 
     def test_multiline_method(self):
         header = get_resource('method/multiline.h')
@@ -305,11 +244,7 @@ class TestParser:
         interface = profile.interfaces['Interface']
         assert interface.name == 'Interface'
         accessor = interface.methods['Encode(int)const']
-        assert accessor == Method(
-            name='Encode(int)const',
-            return_type='int',
-            parameters=[Parameter(name='foo', type='int')],
-        )
+        assert accessor == ENCODE_INT_METHOD
 
     def test_namespaced_interface(self):
         header = get_resource('method/namespace.h')
@@ -390,6 +325,12 @@ class TestParsingOrder:
         with pytest.raises(CircularIncludeError):
             explore_includes([headers / 'a.h'], [headers])
 
+    def test_includes_of_unannotated_header(self):
+        headers = get_resource('include/unannotated')
+        profile = parse([headers / 'a.h'], [headers])
+        assert list(profile.serializable_types) == ['Foo']
+        assert profile.interfaces == {}
+
 
 class TestAnnotations:
     def test_simple_annotation(self):
@@ -418,51 +359,72 @@ class TestAnnotations:
 
 
 class TestFieldParse:
-    def test_simple_field(self):
-        fields = parse_fields('int foo')
-        assert fields == [Field('foo', type_name='int')]
-
-    def test_multiple_fields(self):
-        fields = parse_fields('int foo, bar, baz')
-        assert fields == [
-            Field('foo', type_name='int'),
-            Field('bar', type_name='int'),
-            Field('baz', type_name='int'),
-        ]
-
-    def test_single_field_with_assignment_default(self):
-        fields = parse_fields('int foo = 0')
-        assert fields == [Field('foo', type_name='int')]
-
-    def test_multiple_fields_with_assignment_default(self):
-        fields = parse_fields('int foo = 0, bar = -1, baz = 100')
-        assert fields == [
-            Field('foo', type_name='int'),
-            Field('bar', type_name='int'),
-            Field('baz', type_name='int'),
-        ]
-
-    def test_single_field_with_initializer_default(self):
-        fields = parse_fields('int foo{0}')
-        assert fields == [Field('foo', type_name='int')]
-
-    def test_single_field_with_parenthesis_default(self):
-        fields = parse_fields('int foo(0)')
-        assert fields == [Field('foo', type_name='int')]
-
-    def test_multiple_fields_with_initializer_default(self):
-        fields = parse_fields('int foo{0}, bar{-1}, baz{100}')
-        assert fields == [
-            Field('foo', type_name='int'),
-            Field('bar', type_name='int'),
-            Field('baz', type_name='int'),
-        ]
+    @pytest.mark.parametrize(
+        'text, names, type_name',
+        (
+            pytest.param('int foo', ('foo',), 'int', id='simple_field'),
+            pytest.param(
+                'int foo, bar, baz', ('foo', 'bar', 'baz'), 'int',
+                id='multiple_fields',
+            ),
+            pytest.param(
+                'int foo = 0', ('foo',), 'int',
+                id='single_field_with_assignment_default',
+            ),
+            pytest.param(
+                'int foo = 0, bar = -1, baz = 100',
+                ('foo', 'bar', 'baz'), 'int',
+                id='multiple_fields_with_assignment_default',
+            ),
+            pytest.param(
+                'int foo{0}', ('foo',), 'int',
+                id='single_field_with_initializer_default',
+            ),
+            pytest.param(
+                'int foo(0)', ('foo',), 'int',
+                id='single_field_with_parenthesis_default',
+            ),
+            pytest.param(
+                'int foo{0}, bar{-1}, baz{100}', ('foo', 'bar', 'baz'), 'int',
+                id='multiple_fields_with_initializer_default',
+            ),
+            pytest.param(
+                'int foo = std::max(1, 2), bar{1, 2}, baz',
+                ('foo', 'bar', 'baz'), 'int',
+                id='multiple_fields_with_list_initializers',
+            ),
+            pytest.param(
+                'std::vector<std::uint32_t> collection = {}',
+                ('collection',), 'std::vector<std::uint32_t>',
+                id='templated_collection',
+            ),
+            pytest.param(
+                'std::size_t foo', ('foo',), 'std::size_t',
+                id='namespaced_type',
+            ),
+            pytest.param(
+                'std::map<int, std::string> foo',
+                ('foo',), 'std::map<int,std::string>',
+                id='map_type',
+            ),
+        )
+    )
+    def test_field_parsing(self, text, names, type_name):
+        fields = parse_fields(text)
+        assert fields == [Field(name, type_name=type_name) for name in names]
 
-    def test_templated_collection(self):
-        fields = parse_fields('std::vector<std::uint32_t> collection = {}')
-        assert fields == [
-            Field('collection', type_name='std::vector<std::uint32_t>')
-        ]
+    @pytest.mark.parametrize(
+        'text',
+        (
+            pytest.param('int foo, , bar', id='empty_declarator'),
+            pytest.param('int foo,', id='trailing_comma'),
+            pytest.param('int foo, bar, !!', id='invalid_declarator'),
+            pytest.param('int foo, bar baz', id='unseparated_names'),
+        )
+    )
+    def test_invalid_declarations(self, text):
+        with pytest.raises(InvalidFieldDeclaration):
+            parse_fields(text)
 
     def test_multiline_declaration(self):
         fields = parse_fields("""
@@ -477,126 +439,116 @@ class TestFieldParse:
             Field('c', type_name='int'),
         ]
 
-    def test_namespaced_type(self):
-        fields = parse_fields('std::size_t foo')
-        assert fields == [Field('foo', type_name='std::size_t')]
+    def test_combined_pointer_declaration(self):
+        with pytest.raises(InvalidFieldDeclaration):
+            parse_fields('int foo, *bar')
+
+    @pytest.mark.parametrize('text', ('int foo, *', 'int foo, *bar baz'))
+    def test_invalid_combined_pointer_declaration(self, text):
+        with pytest.raises(InvalidFieldDeclaration):
+            parse_fields(text)
 
 
 class TestMethodParse:
-    def test_unary_function(self):
-        methods = parse_methods('virtual int foo(int x)')
-        assert methods == [
-            Method(
-                'foo(int)',
-                return_type='int',
-                parameters=[Parameter('x', type='int')],
+    @pytest.mark.parametrize(
+        'signature, expected',
+        (
+            pytest.param(
+                'virtual int foo(int x)', (FOO_INT_METHOD,),
+                id='unary_function',
             ),
-        ]
-
-    def test_binary_function(self):
-        methods = parse_methods('virtual int foo(std::string x, std::size_t y)')
-        assert methods == [
-            Method(
-                'foo(std::string,std::size_t)',
-                return_type='int',
-                parameters=[
-                    Parameter('x', type='std::string'),
-                    Parameter('y', type='std::size_t'),
-                ],
+            pytest.param(
+                'virtual int foo(std::string x, std::size_t y)',
+                (
+                    Method(
+                        'foo(std::string,std::size_t)',
+                        return_type='int',
+                        parameters=[
+                            Parameter('x', type='std::string'),
+                            Parameter('y', type='std::size_t'),
+                        ],
+                    ),
+                ),
+                id='binary_function',
             ),
-        ]
-
-    def test_consumer(self):
-        methods = parse_methods('virtual void foo(int x)')
-        assert methods == [
-            Method(
-                'foo(int)',
-                return_type='void',
-                parameters=[Parameter('x', type='int')],
+            pytest.param(
+                'virtual void foo(int x)',
+                (
+                    Method(
+                        'foo(int)',
+                        return_type='void',
+                        parameters=[Parameter('x', type='int')],
+                    ),
+                ),
+                id='consumer',
             ),
-        ]
-
-    def test_producer(self):
-        methods = parse_methods('virtual std::string foo()')
-        assert methods == [
-            Method('foo()', return_type='std::string', parameters=[]),
-        ]
-
-    def test_unary_const_method(self):
-        methods = parse_methods('virtual int foo(int x) const')
-        assert methods == [
-            Method(
-                'foo(int)const',
-                return_type='int',
-                parameters=[Parameter('x', type='int')],
+            pytest.param(
+                'virtual std::string foo()',
+                (Method('foo()', return_type='std::string', parameters=[]),),
+                id='producer',
             ),
-        ]
-
-    def test_pure_virtual_method(self):
-        methods = parse_methods('virtual int f() const = 0')
-        assert methods == [
-            Method('f()const', return_type='int', parameters=[]),
-        ]
-
-    def test_pure_virtual_method_with_tail_return(self):
-        methods = parse_methods('virtual auto f() const -> int = 0')
-        assert methods == [
-            Method('f()const', return_type='int', parameters=[]),
-        ]
-
-    def test_function_with_attribute(self):
-        methods = parse_methods('[[nodiscard]] virtual int foo(int x)')
-        assert methods == [
-            Method(
-                'foo(int)',
-                return_type='int',
-                parameters=[Parameter('x', type='int')],
+            pytest.param(
+                'virtual int foo(int x) const',
+                (
+                    Method(
+                        'foo(int)const',
+                        return_type='int',
+                        parameters=[Parameter('x', type='int')],
+                    ),
+                ),
+                id='unary_const_method',
             ),
-        ]
-
-    def test_function_with_attribute_macro(self):
-        methods = parse_methods(
-            'LIBRARY_DEPRECATED("Don\'t use") virtual int foo(int x)'
-        )
-        assert methods == [
-            Method(
-                'foo(int)',
-                return_type='int',
-                parameters=[Parameter('x', type='int')],
+            pytest.param(
+                'virtual int f() const = 0', (F_CONST_METHOD,),
+                id='pure_virtual_method',
             ),
-        ]
-
-    def test_function_with_default(self):
-        methods = parse_methods('virtual int foo(int x = 0)')
-        assert methods == [
-            Method('foo()', return_type='int', parameters=[]),
-            Method(
-                'foo(int)',
-                return_type='int',
-                parameters=[Parameter('x', type='int')],
+            pytest.param(
+                'virtual auto f() const -> int = 0', (F_CONST_METHOD,),
+                id='pure_virtual_method_with_tail_return',
             ),
-        ]
-
-    def test_function_with_multiple_defaults(self):
-        methods = parse_methods(
-            'virtual int foo(int x = 0, std::string msg = "")'
-        )
-        assert methods == [
-            Method('foo()', return_type='int', parameters=[]),
-            Method(
-                'foo(int)',
-                return_type='int',
-                parameters=[Parameter('x', type='int')],
+            pytest.param(
+                'virtual int foo(int x = std::max(1, 2))',
+                (FOO_METHOD, FOO_INT_METHOD),
+                id='default_containing_commas',
             ),
-            Method(
-                'foo(int,std::string)',
-                return_type='int',
-                parameters=[
-                    Parameter('x', type='int'),
-                    Parameter('msg', type='std::string'),
-                ],
+            pytest.param(
+                '[[nodiscard]] virtual int foo(int x)', (FOO_INT_METHOD,),
+                id='function_with_attribute',
             ),
-        ]
+            pytest.param(
+                'LIBRARY_DEPRECATED("Don\'t use") virtual int foo(int x)',
+                (FOO_INT_METHOD,),
+                id='function_with_attribute_macro',
+            ),
+            pytest.param(
+                'virtual int foo(int x = 0)', (FOO_METHOD, FOO_INT_METHOD),
+                id='function_with_default',
+            ),
+            pytest.param(
+                'virtual int foo(int x = 0, std::string msg = "")',
+                (
+                    FOO_METHOD,
+                    FOO_INT_METHOD,
+                    Method(
+                        'foo(int,std::string)',
+                        return_type='int',
+                        parameters=[
+                            Parameter('x', type='int'),
+                            Parameter('msg', type='std::string'),
+                        ],
+                    ),
+                ),
+                id='function_with_multiple_defaults',
+            ),
+            pytest.param(
+                'int foo(int x) override', (FOO_INT_METHOD,),
+                id='override_function',
+            ),
+        )
+    )
+    def test_method_parsing(self, signature, expected):
+        methods = parse_methods(signature)
+        assert methods == list(expected)
 
     def test_function_with_struct_default(self):
         profile = Profile()
@@ -605,7 +557,7 @@ class TestMethodParse:
         )
         methods = parse_methods('virtual int foo(Conf conf = {})', profile)
         assert methods == [
-            Method('foo()', return_type='int', parameters=[]),
+            FOO_METHOD,
             Method(
                 'foo(Conf)',
                 return_type='int',
@@ -621,16 +573,6 @@ class TestMethodParse:
         with pytest.raises(NonExtendableMethodError):
             parse_methods('int foo(int x) final')  # Cannot be overridden
 
-    def test_override_function(self):
-        methods = parse_methods('int foo(int x) override')
-        assert methods == [
-            Method(
-                'foo(int)',
-                return_type='int',
-                parameters=[Parameter('x', type='int')],
-            ),
-        ]
-
     @pytest.mark.parametrize(
         'signature, exception_type',
         [
@@ -661,7 +603,7 @@ def test_parameter_splitting(text, expected):
 class TestParamParse:
     @pytest.mark.parametrize(
         'text, param_type, name, optional',
-        [
+        (
             ('int x', 'int', 'x', False),
             ('int x = 10', 'int', 'x', True),
             ('std::size_t x = foo[1]', 'std::size_t', 'x', True),
@@ -680,7 +622,7 @@ class TestParamParse:
             ('const int& x', 'int const&', 'x', False),
             ('[[maybe_unused]] const int& x', 'int const&', 'x', False),
             ('LIB_UNUSED int const& x', 'int const&', 'x', False),
-        ]
+        )
     )
     def test_parameter_parsing(self, text, param_type, name, optional):
         param = parse_param(text)
@@ -689,7 +631,7 @@ class TestParamParse:
 
     @pytest.mark.parametrize(
         'text',
-        [
+        (
             'const int* foo = nullptr',
             'const int *foo = nullptr',
             'const int* const* x = nullptr',
@@ -703,7 +645,7 @@ class TestParamParse:
             'const int arr[] = {}',
             'const std::vector<std::size_t>* result',
             'std::vector<int*> pointers',
-        ]
+        )
     )
     def test_reference_param_detection(self, text):
         with pytest.raises(ReferenceParamError):
@@ -711,10 +653,10 @@ class TestParamParse:
 
     @pytest.mark.parametrize(
         'text',
-        [
+        (
             'int (*x)(double)',
             'int (*(*x)(double))[3] = nullptr',
-        ]
+        )
     )
     def test_function_pointer_param(self, text):
         """
@@ -729,12 +671,12 @@ class TestParamParse:
 
     @pytest.mark.parametrize(
         'text',
-        [
+        (
             'long x',
             'const short x = 0',
             'char c',
             'std::array<std::int32_t, 4> arr',
-        ]
+        )
     )
     def test_unsupported_parameter_types(self, text):
         """
@@ -745,14 +687,14 @@ class TestParamParse:
 
     @pytest.mark.parametrize(
         'text',
-        [
+        (
             'invalid x',
             'std::invalid x',
             'std::vector<invalid> x',
             'std::vector<std::vector<invalid>> x',
             'std::map<invalid, int> x',
             'std::map<int, invalid> x',
-        ]
+        )
     )
     def test_invalid_types(self, text):
         """
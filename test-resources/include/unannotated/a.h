@@ -0,0 +1,8 @@
+/**
+ * File without annotations, which includes an annotated header.
+ */
+#include "b.h"
+
+struct Unannotated {
+  int id;
+};
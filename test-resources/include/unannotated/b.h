@@ -0,0 +1,9 @@
+/**
+ * Annotated file included by a file without annotations.
+ */
+#include <string>
+
+// @IPC(Serializable)
+struct Foo {
+  std::string name;
+};
@@ -0,0 +1,13 @@
+
+#include <cstddef>
+#include <string>
+
+/*
+ * Comment text, such as http://example.com, is skipped.
+ */
+
+// @IPC(Serializable)
+struct Foo {
+  /* Comment // containing a line comment. */ std::size_t id;
+  /* x *//* y */ std::string name;  // Comment /* containing a block comment.
+};
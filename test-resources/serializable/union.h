@@ -0,0 +1,6 @@
+
+// @IPC(Serializable)
+union Foo {
+  int a;
+  float b;
+};